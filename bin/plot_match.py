@@ -5,6 +5,11 @@ import boto3
 import re
 import uuid
 
+import matplotlib
+
+matplotlib.use("agg")
+from matplotlib import pyplot as plt
+
 from pybalance.utils import MatchingData
 from pybalance.visualization import (
     plot_numeric_features,
@@ -30,7 +35,8 @@ def _setup_matching_data(
         weights = dict(zip(feature_list["feature"], feature_list["weight"]))
         # Assume missing features have 0 weight. FIXME don't hardcode name of
         # cols to ignore.
-        missing_features = set(weights.keys()) - set(data.columns.tolist())
+        columns = set(data.columns)
+        missing_features = [f for f in weights if f not in columns]
         if len(missing_features) > 0:
             if on_missing_features == "warn":
                 logger.warning(
@@ -82,6 +88,10 @@ def save_mpl_fig(fig, output_path):
     else:
         os.rename(local_path, output_path)
 
+    # Release the figure from pyplot's registry. Seaborn grids (e.g. from
+    # plot_propensity_score_match_distributions) wrap the figure to close.
+    plt.close(fig if isinstance(fig, plt.Figure) else fig.figure)
+
 
 def save_pandas_table(df, output_path):
     # Save locally
@@ -154,6 +164,10 @@ def write_summary_tables(match, match_path):
 
 
 def write_summary_plots(match, match_path, feature_weights=None):
+    """
+    feature_weights is a {feature: weight} mapping; binary features with weight
+    > 1 get an additional plot.
+    """
     logger.info(f"Writing summary plots for match {match_path} ...")
 
     logger.info("Plotting 1d marginals ...")
@@ -165,12 +179,7 @@ def write_summary_plots(match, match_path, feature_weights=None):
     save_mpl_fig(fig, re.sub(".csv|.parquet", "_binary_features.png", match_path))
 
     if feature_weights is not None:
-        feature_weights = pd.read_csv(feature_weights, comment="#")[
-            ["feature", "weight"]
-        ].dropna()
-        high_priority_features = feature_weights[
-            feature_weights.weight > 1
-        ].feature.tolist()
+        high_priority_features = [f for f, w in feature_weights.items() if w > 1]
         if len(high_priority_features) > 0:
             logger.info("Plotting high weight binary features ...")
             fig = plot_binary_features(match, include_only=high_priority_features)
@@ -197,13 +206,15 @@ def main(args):
 
     if args.features is not None:
         prematch_data, weights = _setup_matching_data(args.features, args.feature_list)
-        prematch_data.loc[:, "population"] = (
-            prematch_data["population"] + " (pre-match)"
+        # Relabel the categories, not every row
+        populations = prematch_data["population"].astype("category")
+        prematch_data["population"] = populations.cat.rename_categories(
+            lambda p: f"{p} (pre-match)"
         )
         match.append(prematch_data)
 
     write_summary_tables(match, args.match)
-    write_summary_plots(match, args.match, args.feature_list)
+    write_summary_plots(match, args.match, weights)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,6 @@
 from typing import Dict
 import pandas as pd
 import argparse
-import copy
 import os
 import boto3
 
@@ -29,6 +28,10 @@ from pybalance.utils.matching_data import (
 )
 from plot_match import save_mpl_fig
 
+# The base calculator has no preprocessing of its own and cannot be selected as
+# an objective by name.
+OBJECTIVES = tuple(k for k in BALANCE_CALCULATORS if k != "base")
+
 
 def _setup_matching_data(
     input_path, feature_list_path, dropna=True, on_missing_features="warn"
@@ -40,7 +43,8 @@ def _setup_matching_data(
         weights = dict(zip(feature_list["feature"], feature_list["weight"]))
         # Assume missing features have 0 weight. FIXME don't hardcode name of
         # cols to ignore.
-        missing_features = set(weights.keys()) - set(data.columns.tolist())
+        columns = set(data.columns)
+        missing_features = [f for f in weights if f not in columns]
         if len(missing_features) > 0:
             if on_missing_features == "warn":
                 logger.warning(
@@ -71,18 +75,19 @@ def _setup_matching_data(
 
 def duplicate_target(matching_data, n=1):
     target, pool = split_target_pool(matching_data)
-    target = copy.copy(target)
 
+    n_copies = 1
     if n is not None and n != 1:
         assert int(n) == n and n > 1
         # Not defined for other parameters in this case!
-        target = pd.concat([target] * int(n))
+        n_copies = int(n)
 
-    if len(target) > len(pool):
+    if n_copies * len(target) > len(pool):
         raise ValueError(f"Pool is not large enough for {n}:1 matching.")
 
+    # Target rows are repeated n_copies times ahead of the pool.
     return MatchingData(
-        data=pd.concat([target, pool]),
+        data=pd.concat([target] * n_copies + [pool]),
         headers=matching_data.headers,
         population_col=matching_data.population_col,
     )
@@ -96,7 +101,7 @@ def ea_train(matching_data, bc, args):
         "max_batch_size_gb": 2,
         "verbose": True,
         "time_limit": args.time_limit,
-        "objective": args.objective,
+        "objective": bc,
         "n_iter_no_change": 10000,
         "initialization": {
             "benchmarks": {"propensity": "include"},
@@ -111,10 +116,7 @@ def ea_train(matching_data, bc, args):
     matcher = GeneticMatcher(matching_data, **params)
 
     if args.seed is not None:
-        if args.seed.endswith(".parquet"):
-            seed = pd.read_parquet(args.seed)
-        else:
-            seed = pd.read_csv(args.seed)
+        seed = _load_matching_data(args.seed, columns=["patient_id"])
 
         _, pool = split_target_pool(matching_data)
         # We need to get the indices of the seed patients in the pool. Note that
@@ -134,7 +136,7 @@ def ea_train(matching_data, bc, args):
 
 def lp_train(matching_data, bc, args):
     params = {
-        "objective": args.objective,
+        "objective": bc,
         "time_limit": args.time_limit,
         "num_workers": args.num_workers,
         "verbose": True,
@@ -143,10 +145,7 @@ def lp_train(matching_data, bc, args):
     }
 
     if args.seed is not None:
-        if args.seed.endswith(".parquet"):
-            seed = pd.read_parquet(args.seed)
-        else:
-            seed = pd.read_csv(args.seed)
+        seed = _load_matching_data(args.seed, columns=["patient_id"])
 
         _, pool = split_target_pool(matching_data)
         # We need to get the indices of the seed patients in the pool. Note that
@@ -167,7 +166,7 @@ def lp_train(matching_data, bc, args):
 
 def ps_train(matching_data, bc, args):
     params = {
-        "objective": args.objective,
+        "objective": bc,
         "time_limit": args.time_limit,
         "max_iter": 1000,
         "method": args.method,
@@ -234,12 +233,13 @@ def parse_command_line():
         "--objective",
         action="store",
         default="beta",
-        choices=list(BALANCE_CALCULATORS.keys()),
+        choices=OBJECTIVES,
         help="Objective function to optimize.",
     )
 
     parser.add_argument(
         "--n-bins",
+        type=int,
         action="store",
         default=10,
         help="For objective functions that bin numeric variables, how many bins to use.",
@@ -388,6 +388,8 @@ def main(args):
     matching_data = MatchingData(data=data, population_col="population")
     matching_data = duplicate_target(matching_data, n=args.n_to_one_matching)
 
+    # Features listed without a weight keep the calculator's default weight.
+    feature_weights = {f: w for f, w in feature_weights.items() if pd.notna(w)}
     bc = get_balance_calculator(
         matching_data, args.objective, feature_weights, args.n_bins
     )
@@ -0,0 +1,29 @@
+import os
+import sys
+
+from matplotlib import pyplot as plt
+import seaborn as sns
+
+from pybalance.sim import generate_toy_dataset
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from plot_match import save_mpl_fig
+
+
+def test_save_mpl_fig_figure(tmp_path):
+    fig = plt.figure()
+    output_path = str(tmp_path / "figure.png")
+    save_mpl_fig(fig, output_path)
+
+    assert os.path.exists(output_path)
+    assert not plt.fignum_exists(fig.number)
+
+
+def test_save_mpl_fig_facet_grid(tmp_path):
+    m = generate_toy_dataset(n_pool=200, n_target=20)
+    g = sns.displot(data=m.data, x="age", hue="population")
+    output_path = str(tmp_path / "grid.png")
+    save_mpl_fig(g, output_path)
+
+    assert os.path.exists(output_path)
+    assert not plt.fignum_exists(g.figure.number)
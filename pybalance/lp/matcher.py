@@ -357,7 +357,7 @@ class ConstraintSatisfactionMatcher(object):
 
         headers = self.balance_calculator.preprocessor.output_headers["all"]
         for feat, weight in zip(headers, weights):
-            logger.debug(f"Feature weights: {weight:6d} {feat}")
+            logger.debug("Feature weights: %6d %s", weight, feat)
 
         return weights
 
@@ -441,7 +441,11 @@ class ConstraintSatisfactionMatcher(object):
 
             feat = self.balance_calculator.preprocessor.output_headers["all"][i]
             logger.debug(
-                f"Feature limits: [{bounds_features_min[-1]}, {bounds_features_max[-1]}] {feat} (max delta: {bounds_abs_deltas[-1]})"
+                "Feature limits: [%s, %s] %s (max delta: %s)",
+                bounds_features_min[-1],
+                bounds_features_max[-1],
+                feat,
+                bounds_abs_deltas[-1],
             )
 
         # Variables for calculating mean absolute difference per feature
@@ -507,7 +511,9 @@ class ConstraintSatisfactionMatcher(object):
             model.AddAbsEquality(abs_deltas[j], deltas[j])
             if self.max_mismatch is not None:
                 logger.debug(
-                    f"Applying mismatch <= {self.max_mismatch} constraint on feature {i} ..."
+                    "Applying mismatch <= %s constraint on feature %s ...",
+                    self.max_mismatch,
+                    i,
                 )
                 model.Add(
                     abs_deltas[j]
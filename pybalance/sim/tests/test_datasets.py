@@ -1,3 +1,5 @@
+import numpy as np
+
 from pybalance.utils import split_target_pool
 from pybalance.sim import load_paper_dataset, generate_toy_dataset
 
@@ -14,3 +16,13 @@ def test_generator1():
     target, pool = split_target_pool(m)
     assert len(pool) == 12345
     assert len(target) == 234
+
+
+def test_generator_reseeds_global_rng():
+    # Callers rely on generate_toy_dataset() leaving numpy's global RNG in the
+    # same state on every call, e.g. for reproducible unseeded .sample().
+    generate_toy_dataset(n_pool=1234, n_target=123)
+    x1 = np.random.rand()
+    generate_toy_dataset(n_pool=1234, n_target=123)
+    x2 = np.random.rand()
+    assert x1 == x2
@@ -67,7 +67,7 @@ def infer_matching_headers(
 
     headers = MatchingHeaders(numeric=numeric_cols, categoric=categoric_cols)
 
-    logger.debug(f"Inferred headers: {headers}")
+    logger.debug("Inferred headers: %s", headers)
 
     return headers
 
@@ -88,11 +88,13 @@ def _make_quantile_function(q):
     return f
 
 
-def _load_matching_data(path):
+def _load_matching_data(path, columns=None):
+    # Dispatch on the file extension so each file is parsed exactly once, and
+    # only the requested columns (all, if None) are read.
     if path.endswith(".csv") or path.endswith("csv.gz"):
-        data = pd.read_csv(path)
+        data = pd.read_csv(path, usecols=columns)
     elif path.endswith(".parquet"):
-        data = pd.read_parquet(path)
+        data = pd.read_parquet(path, columns=columns)
     else:
         raise ValueError(f"Unknown file format: {path}.")
     return data
@@ -230,18 +232,18 @@ class MatchingData(object):
         Append a population to an existing MatchingData instance. This operation
         is inplace.
         """
-        if not set([self.population_col] + self.headers["all"]) <= set(df.columns):
-            missing_columns = set([self.population_col] + self.headers["all"]) - set(
-                df.columns
-            )
+        columns = set(df.columns)
+        missing_columns = [
+            c for c in [self.population_col] + self.headers["all"] if c not in columns
+        ]
+        if missing_columns:
             raise ValueError(
-                f"Required columns {list(missing_columns)} are missing from data to be appended."
+                f"Required columns {missing_columns} are missing from data to be appended."
             )
 
-        # copy input data to avoid undesired side effects
-        df = copy.deepcopy(df)
+        # pd.concat copies df; assign() relabels on a copy, leaving df untouched.
         if name is not None:
-            df.loc[:, self.population_col] = name
+            df = df.assign(**{self.population_col: name})
 
         self._data = pd.concat([self._data, df])
 
@@ -288,10 +290,11 @@ Populations:
     def __len__(self):
         return len(self.data)
 
-    def counts(self):
-        counts = self.data.reset_index().groupby(self.population_col).count()[["index"]]
-        counts.columns = ["N"]
-        return counts
+    def counts(self) -> pd.DataFrame:
+        """
+        Number of rows per population.
+        """
+        return self.data.groupby(self.population_col).size().to_frame("N")
 
     def describe_numeric(
         self,
@@ -305,7 +308,7 @@ Populations:
         # numeric
         aggregations = aggregations + [_make_quantile_function(q) for q in quantiles]
         agg = dict((c, aggregations) for c in self.headers["numeric"])
-        agg = self.data.reset_index().groupby(self.population_col).agg(agg).T
+        agg = self.data.groupby(self.population_col).agg(agg).T
         agg.columns = [c for c in agg.columns]
         agg = agg.round(decimals=2)
 
@@ -328,15 +331,12 @@ Populations:
         # categoric
         out = [counts]
         for cat in self.headers["categoric"]:
-            tmp = (
-                self.data.reset_index()
-                .groupby(["population", cat])
-                .count()[["index"]]
-                .reset_index()
-            )
+            # Number of rows per (population, value)
+            tmp = self.data.groupby(["population", cat]).size().rename("N")
+            tmp = tmp.reset_index()
             tmp.loc[:, "feature"] = cat
             tmp = tmp.pivot(
-                index=["feature", cat], columns=["population"], values=["index"]
+                index=["feature", cat], columns=["population"], values=["N"]
             )
             tmp.columns = [c[1] for c in tmp.columns]
             tmp.index.names = ["feature", "value"]
@@ -382,30 +382,29 @@ def split_target_pool(
     if isinstance(target_name, str) and isinstance(pool_name, str):
         target = matching_data.get_population(target_name)
         pool = matching_data.get_population(pool_name)
-    elif isinstance(target_name, str) or isinstance(pool_name, str):
-        if len(matching_data.populations) != 2:
-            raise ValueError(
-                f"""
-            Cannot split into exactly two populations based on {matching_data.population_col}.
-            Found populations: {','.join(matching_data.populations)}.
-            """
-            )
+        return target, pool
+
+    # Each access to matching_data.populations scans the full population
+    # column, so look them up only once.
+    populations = matching_data.populations
+    if len(populations) != 2:
+        raise ValueError(
+            f"""
+        Cannot split into exactly two populations based on {matching_data.population_col}.
+        Found populations: {','.join(populations)}.
+        """
+        )
+
+    if isinstance(target_name, str) or isinstance(pool_name, str):
         if isinstance(target_name, str):
-            pool_name = [p for p in matching_data.populations if p != target_name][0]
+            pool_name = [p for p in populations if p != target_name][0]
         if isinstance(pool_name, str):
-            target_name = [p for p in matching_data.populations if p != pool_name][0]
+            target_name = [p for p in populations if p != pool_name][0]
         target = matching_data.get_population(target_name)
         pool = matching_data.get_population(pool_name)
     else:
-        if len(matching_data.populations) != 2:
-            raise ValueError(
-                f"""
-            Cannot split into exactly two populations based on {matching_data.population_col}.
-            Found populations: {','.join(matching_data.populations)}.
-            """
-            )
-        inferred_pool_name = matching_data.populations[0]
-        inferred_target_name = matching_data.populations[1]
+        inferred_pool_name = populations[0]
+        inferred_target_name = populations[1]
         target = matching_data.get_population(inferred_target_name)
         pool = matching_data.get_population(inferred_pool_name)
 
@@ -222,3 +222,28 @@ def test_specified_headers():
     m = MatchingData(df, headers=headers)
     assert m.headers["categoric"] == []
     assert m.headers["numeric"] == ["cat3"]
+
+
+def test_matching_data_append_no_side_effects():
+    N_pool, N_target = 1000, 100
+    pool_name, target_name = "p", "t"
+    data = _make_fake_matching_data(N_pool, N_target, pool_name, target_name)
+    matching_data = MatchingData(data, population_col="population")
+
+    # appending under a new name must not relabel the caller's frame
+    match = matching_data.get_population(pool_name).sample(N_target)
+    matching_data.append(match, name="match")
+    assert match["population"].unique().tolist() == [pool_name]
+
+    # nor should later changes to the caller's frame leak into matching_data
+    match.loc[:, "cat_col_7"] = "changed"
+    assert "changed" not in matching_data.get_population("match")["cat_col_7"].values
+
+
+def test_counts():
+    m = generate_toy_dataset(n_pool=1234, n_target=123)
+    counts = m.counts()
+    assert counts.columns.tolist() == ["N"]
+    assert counts.index.name == m.population_col
+    assert counts.loc["pool", "N"] == 1234
+    assert counts.loc["target", "N"] == 123
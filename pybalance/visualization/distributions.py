@@ -22,7 +22,8 @@ logger = logging.getLogger(__name__)
 
 
 def _get_default_hue_order(matching_data: MatchingData) -> List[str]:
-    return sorted(matching_data.populations)
+    # MatchingData.populations already returns a new, sorted list.
+    return matching_data.populations
 
 
 def _get_reference_population(matching_data: MatchingData) -> str:
@@ -115,7 +116,8 @@ def plot_categoric_features(
     # Determine which covariates to plot.
     headers = matching_data.headers["categoric"]
     if not include_binary:
-        headers = [c for c in headers if matching_data[c].nunique() > 2]
+        n_unique = matching_data.data[headers].nunique()
+        headers = n_unique[n_unique > 2].index.tolist()
 
     # PLOT!
     fig = _plot_1d_marginals(matching_data, headers, col_wrap, height, **default_params)
@@ -199,7 +201,8 @@ def plot_binary_features(
     :param plot_params: Parameters passed on to seaborn routines.
     """
     # FIXME this should be renamed to something like plot_difference_binary_features
-    if len(matching_data.populations) < 2:
+    hue_order = _get_default_hue_order(matching_data)
+    if len(hue_order) < 2:
         raise ValueError(
             "plot_binary_features() only implemented for MatchingData with >= 2 populations."
         )
@@ -209,22 +212,20 @@ def plot_binary_features(
 
     default_params = {
         "hue": matching_data.population_col,
-        "hue_order": _get_default_hue_order(matching_data),
+        "hue_order": hue_order,
     }
     default_params.update(plot_params)
 
-    binary_cols = [
-        c
-        for c in matching_data.headers["categoric"]
-        if matching_data.data[c].nunique() == 2
-    ]
+    n_unique = matching_data.data[matching_data.headers["categoric"]].nunique()
+    binary_cols = n_unique[n_unique == 2].index.tolist()
     binary_cols = [c for c in binary_cols if include_only is None or c in include_only]
 
     if len(binary_cols) == 0:
         logger.warning("No binary features found!!")
         return None
 
-    data = matching_data.copy().data
+    # Only the binary columns are re-ranked below, so avoid copying the rest.
+    data = matching_data.data[[matching_data.population_col] + binary_cols].copy()
     data.loc[:, binary_cols] = data[binary_cols].rank(method="dense") - 1
 
     # Frequencies